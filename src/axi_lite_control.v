@@ -1,16 +1,18 @@
 // -----------------------------------------------------------------------------
 // ļ: src/axi_lite_control.v
-// 汾: 1.2 (Fix reg/assign conflict)
+// 汾: 1.4 (M-Chunk Wait Counter)
 // : AXI4-Lite Slave ƽӿ
 //       - ޸ o_soft_rst_n Ͷ
 //       -  PPU Ĵ
+//       - ַλչ 7-bitֻܼĴ (0x28 ~ 0x4C)
+//       -  M_WAIT  (0x50)
 // -----------------------------------------------------------------------------
 
 `timescale 1ns / 1ps
 
 module axi_lite_control #(
     parameter C_S_AXI_DATA_WIDTH = 32,
-    parameter C_S_AXI_ADDR_WIDTH = 6 
+    parameter C_S_AXI_ADDR_WIDTH = 7 
 )(
     // --- Global Signals ---
     input  wire                                 clk,
@@ -48,7 +50,20 @@ module axi_lite_control #(
     output wire [4:0]                           o_ppu_shift,
     output wire [7:0]                           o_ppu_zp,
     output wire [31:0]                          o_ppu_bias,   // [FIX] ֮ǰ placeholderڽ߼
-    output wire                                 o_output_en   // [NEW]  PPU Ƿ
+    output wire                                 o_output_en,  // [NEW]  PPU Ƿ
+
+    // --- Performance Counters ---
+    output reg                                  o_perf_clear,  // Pulse, д 0x28 Bit 0
+    input  wire [31:0]                          i_cnt_busy,
+    input  wire [31:0]                          i_cnt_idle,
+    input  wire [31:0]                          i_cnt_load_w,
+    input  wire [31:0]                          i_cnt_compute,
+    input  wire [31:0]                          i_cnt_drain,
+    input  wire [31:0]                          i_cnt_done,
+    input  wire [31:0]                          i_cnt_in_stall,
+    input  wire [31:0]                          i_cnt_axis_in_bp,
+    input  wire [31:0]                          i_cnt_axis_out_bp,
+    input  wire [31:0]                          i_cnt_m_wait
 );
 
     // -------------------------------------------------------------------------
@@ -67,6 +82,18 @@ module axi_lite_control #(
     // [NEW] Ĵַ
     localparam ADDR_PPU_BIAS    = 6'h20; // 32-bit Bias
     localparam ADDR_OUTPUT_EN   = 6'h24; // 1-bit Enable
+    // [NEW] ܼ (ֻ, д PERF_CTRL Bit 0 )
+    localparam ADDR_PERF_CTRL   = 7'h28;
+    localparam ADDR_PERF_BUSY   = 7'h2C;
+    localparam ADDR_PERF_IDLE   = 7'h30;
+    localparam ADDR_PERF_LOAD_W = 7'h34;
+    localparam ADDR_PERF_COMP   = 7'h38;
+    localparam ADDR_PERF_DRAIN  = 7'h3C;
+    localparam ADDR_PERF_DONE   = 7'h40;
+    localparam ADDR_PERF_STALL  = 7'h44; // COMPUTE  Input Valid ȱʧ
+    localparam ADDR_PERF_IN_BP  = 7'h48; // AXIS In  TVALID && !TREADY
+    localparam ADDR_PERF_OUT_BP = 7'h4C; // AXIS Out TVALID && !TREADY
+    localparam ADDR_PERF_M_WAIT = 7'h50; // M-Chunk ֮ĵȴ
     localparam VERSION_ID       = 32'h20260117;
 
     // -------------------------------------------------------------------------
@@ -92,11 +119,13 @@ module axi_lite_control #(
             reg_ctrl <= 0; reg_cfg_k <= 0; reg_cfg_acc <= 0;
             reg_ppu_mult <= 0; reg_ppu_shift <= 0; reg_ppu_zp <= 0;
             o_ap_start <= 0;
+            o_perf_clear <= 0;
             reg_ppu_bias <= 0;
             reg_output_en <= 0;
         end else begin
             // Default: Clear Pulse
             if (o_ap_start) o_ap_start <= 0;
+            if (o_perf_clear) o_perf_clear <= 0;
 
             s_axi_awready <= 0; s_axi_wready <= 0;
             
@@ -104,26 +133,28 @@ module axi_lite_control #(
             if (!s_axi_awready && !s_axi_wready && s_axi_awvalid && s_axi_wvalid) begin
                 s_axi_awready <= 1; s_axi_wready <= 1;
                 
-                case (s_axi_awaddr[5:2])
-                    4'h0: begin // 0x00 CTRL
+                case (s_axi_awaddr[6:2])
+                    5'h00: begin // 0x00 CTRL
                         if (s_axi_wstrb[0]) begin
                              if (s_axi_wdata[0]) o_ap_start <= 1; // Trigger Pulse
                              reg_ctrl[1] <= s_axi_wdata[1];       // Soft Reset Level
                         end
                     end
-                    4'h1: begin // 0x04 STATUS (W1C for Bit 0)
+                    5'h01: begin // 0x04 STATUS (W1C for Bit 0)
                         if (s_axi_wstrb[0] && s_axi_wdata[0]) reg_status[0] <= 0;
                     end
-                    4'h2: if (s_axi_wstrb[0]) reg_cfg_k <= s_axi_wdata;
-                    4'h3: if (s_axi_wstrb[0]) reg_cfg_acc <= s_axi_wdata;
+                    5'h02: if (s_axi_wstrb[0]) reg_cfg_k <= s_axi_wdata;
+                    5'h03: if (s_axi_wstrb[0]) reg_cfg_acc <= s_axi_wdata;
                     
                     // PPU Configs
-                    4'h5: if (s_axi_wstrb[0]) reg_ppu_mult <= s_axi_wdata;
-                    4'h6: if (s_axi_wstrb[0]) reg_ppu_shift <= s_axi_wdata;
-                    4'h7: if (s_axi_wstrb[0]) reg_ppu_zp <= s_axi_wdata;
+                    5'h05: if (s_axi_wstrb[0]) reg_ppu_mult <= s_axi_wdata;
+                    5'h06: if (s_axi_wstrb[0]) reg_ppu_shift <= s_axi_wdata;
+                    5'h07: if (s_axi_wstrb[0]) reg_ppu_zp <= s_axi_wdata;
                     // [NEW] Bias & Output Enable
-                    4'h8: if (s_axi_wstrb[0]) reg_ppu_bias <= s_axi_wdata;  // 0x20
-                    4'h9: if (s_axi_wstrb[0]) reg_output_en <= s_axi_wdata; // 0x24
+                    5'h08: if (s_axi_wstrb[0]) reg_ppu_bias <= s_axi_wdata;  // 0x20
+                    5'h09: if (s_axi_wstrb[0]) reg_output_en <= s_axi_wdata; // 0x24
+                    // [NEW] Performance Counter Clear
+                    5'h0A: if (s_axi_wstrb[0] && s_axi_wdata[0]) o_perf_clear <= 1; // 0x28
                 endcase
             end
 
@@ -145,7 +176,7 @@ module axi_lite_control #(
             
             // Sticky Done Logic
             if (i_ap_done) reg_status[0] <= 1;
-            else if (s_axi_awready && s_axi_wvalid && s_axi_awaddr[4:2] == 3'h1 && s_axi_wdata[0]) 
+            else if (s_axi_awready && s_axi_wvalid && s_axi_awaddr[6:2] == 5'h01 && s_axi_wdata[0]) 
                 reg_status[0] <= 0; // Clear on W1C
         end
     end
@@ -159,17 +190,28 @@ module axi_lite_control #(
         end else begin
             if (!s_axi_arready && s_axi_arvalid) begin
                 s_axi_arready <= 1;
-                case (s_axi_araddr[5:2])
-                    4'h0: s_axi_rdata <= reg_ctrl;
-                    4'h1: s_axi_rdata <= reg_status;
-                    4'h2: s_axi_rdata <= reg_cfg_k;
-                    4'h3: s_axi_rdata <= reg_cfg_acc;
-                    4'h4: s_axi_rdata <= VERSION_ID;
-                    4'h5: s_axi_rdata <= reg_ppu_mult;
-                    4'h6: s_axi_rdata <= reg_ppu_shift;
-                    4'h7: s_axi_rdata <= reg_ppu_zp;
-                    4'h8: s_axi_rdata <= reg_ppu_bias; // [NEW]
-                    4'h9: s_axi_rdata <= reg_output_en; // [NEW]
+                case (s_axi_araddr[6:2])
+                    5'h00: s_axi_rdata <= reg_ctrl;
+                    5'h01: s_axi_rdata <= reg_status;
+                    5'h02: s_axi_rdata <= reg_cfg_k;
+                    5'h03: s_axi_rdata <= reg_cfg_acc;
+                    5'h04: s_axi_rdata <= VERSION_ID;
+                    5'h05: s_axi_rdata <= reg_ppu_mult;
+                    5'h06: s_axi_rdata <= reg_ppu_shift;
+                    5'h07: s_axi_rdata <= reg_ppu_zp;
+                    5'h08: s_axi_rdata <= reg_ppu_bias; // [NEW]
+                    5'h09: s_axi_rdata <= reg_output_en; // [NEW]
+                    // [NEW] Performance Counters (0x28  0)
+                    5'h0B: s_axi_rdata <= i_cnt_busy;        // 0x2C
+                    5'h0C: s_axi_rdata <= i_cnt_idle;        // 0x30
+                    5'h0D: s_axi_rdata <= i_cnt_load_w;      // 0x34
+                    5'h0E: s_axi_rdata <= i_cnt_compute;     // 0x38
+                    5'h0F: s_axi_rdata <= i_cnt_drain;       // 0x3C
+                    5'h10: s_axi_rdata <= i_cnt_done;        // 0x40
+                    5'h11: s_axi_rdata <= i_cnt_in_stall;    // 0x44
+                    5'h12: s_axi_rdata <= i_cnt_axis_in_bp;  // 0x48
+                    5'h13: s_axi_rdata <= i_cnt_axis_out_bp; // 0x4C
+                    5'h14: s_axi_rdata <= i_cnt_m_wait;      // 0x50
                     default: s_axi_rdata <= 0;
                 endcase
             end else begin
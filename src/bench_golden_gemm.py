@@ -0,0 +1,60 @@
+import numpy as np
+import timeit
+
+from golden_gemm import golden_matmul, select_path
+
+# ==============================================================================
+# Benchmark: golden_matmul vs np.matmul(...astype(np.int32))
+# ==============================================================================
+# DeiT-Tiny: Tokens = 197, Embed = 192, Heads = 3, Head Dim = 64, MLP = 768
+# 用法: python src/bench_golden_gemm.py
+SHAPES = [
+    # (名称,            Batch, M,   K,   N)
+    ("Patch Embed",     1,     196, 768, 192),
+    ("QKV Proj",        1,     197, 192, 576),
+    ("Attn QK^T",       3,     197, 64,  197),
+    ("Attn AV",         3,     197, 197, 64),
+    ("Attn Out Proj",   1,     197, 192, 192),
+    ("MLP FC1",         1,     197, 192, 768),
+    ("MLP FC2",         1,     197, 768, 192),
+    ("Classifier Head", 1,     1,   192, 1000),
+]
+
+REPEAT = 5
+
+def baseline_matmul(mat_a, mat_b):
+    return np.matmul(mat_a.astype(np.int32), mat_b.astype(np.int32))
+
+def best_time(fn):
+    number = 3
+    return min(timeit.repeat(fn, number=number, repeat=REPEAT)) / number
+
+def run_benchmark():
+    rng = np.random.default_rng(0)
+    print(f"{'Layer':<16} {'Shape (BxMxKxN)':<20} {'Path':<13} "
+          f"{'int32 (ms)':>11} {'golden (ms)':>12} {'Speedup':>8}")
+    total_base = total_fast = 0.0
+
+    for name, batch, m_dim, k_dim, n_dim in SHAPES:
+        mat_a = rng.integers(-128, 128, size=(batch, m_dim, k_dim), dtype=np.int8)
+        mat_b = rng.integers(-128, 128, size=(batch, k_dim, n_dim), dtype=np.int8)
+
+        ref = baseline_matmul(mat_a, mat_b)
+        out = golden_matmul(mat_a, mat_b)
+        assert np.array_equal(ref, out), f"{name}: golden_matmul 结果不一致"
+
+        t_base = best_time(lambda: baseline_matmul(mat_a, mat_b))
+        t_fast = best_time(lambda: golden_matmul(mat_a, mat_b))
+        total_base += t_base
+        total_fast += t_fast
+
+        path, _ = select_path(k_dim, 128, 128)
+        shape = f"{batch}x{m_dim}x{k_dim}x{n_dim}"
+        print(f"{name:<16} {shape:<20} {path:<13} "
+              f"{t_base * 1e3:>11.3f} {t_fast * 1e3:>12.3f} {t_base / t_fast:>7.1f}x")
+
+    print(f"{'Total':<16} {'':<20} {'':<13} "
+          f"{total_base * 1e3:>11.3f} {total_fast * 1e3:>12.3f} {total_base / total_fast:>7.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
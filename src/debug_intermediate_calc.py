@@ -1,5 +1,7 @@
 import numpy as np
 
+from golden_gemm import golden_matmul
+
 # ==============================================================================
 # 配置区域
 # ==============================================================================
@@ -110,12 +112,12 @@ W_k1 = load_weight_64bit(FILE_W_K1, K, N)
 
 # 2. Step 1: Calculate Partial Sum (K=0)
 # Corresponds to hardware behavior after first K-loop
-Acc_step1 = np.dot(A_k0, W_k0).astype(np.int32)
+Acc_step1 = golden_matmul(A_k0, W_k0)
 save_debug_file("debug_k0_partial.txt", Acc_step1, "Step 1: A_k0 * W_k0 (Accumulator Value)")
 
 # 3. Step 2: Accumulate (K=1)
 # Corresponds to hardware behavior after second K-loop
-Acc_step2 = Acc_step1 + np.dot(A_k1, W_k1).astype(np.int32)
+Acc_step2 = Acc_step1 + golden_matmul(A_k1, W_k1)
 save_debug_file("debug_k1_final.txt", Acc_step2, "Step 2: Acc + A_k1 * W_k1 (Final Accumulator Value)")
 
 # 4. PPU Simulation (Optional Check)
@@ -4,8 +4,11 @@
 // 描述: DeiT 加速器顶层模块
 //       - 包含 Input/Weight Buffer 的握手连接
 //       - 包含 DMA 下降沿触发的 Bank Swap
-//       - 包含 Output Buffer (FIFO) 以平滑输出流
+//       - 包含 Output Buffer (FIFO) 以平滑输出流，深度与 Accumulator 相同 (2^ACC_ADDR_WIDTH)
 //       - LATENCY_CFG 修正为 27
+//       - 性能计数器 (perf_counters)，经 AXI-Lite 0x28 ~ 0x50 读出/清零
+//       - M-Chunk Chaining: M 可超过 Input Buffer 深度 (上限 2^ACC_ADDR_WIDTH)，
+//         Host 按 256 行分块发送输入 (每块以 TLAST 结束)，写 Bank 满时反压 TREADY
 // -----------------------------------------------------------------------------
 
 `timescale 1ns / 1ps
@@ -13,7 +16,8 @@
 
 module deit_accelerator_top #(
     parameter C_S_AXI_DATA_WIDTH = 32,
-    parameter C_S_AXI_ADDR_WIDTH = 6 
+    parameter C_S_AXI_ADDR_WIDTH = 7,
+    parameter ACC_ADDR_WIDTH     = 9  // Accumulator / Output FIFO 深度 = 单 Job 最大 M (512)
 )(
     input  wire                                 clk,
     input  wire                                 rst_n, 
@@ -60,10 +64,19 @@ module deit_accelerator_top #(
     wire [31:0] cfg_ppu_bias; 
     wire        cfg_output_en; 
 
+    // Performance Counters
+    wire        perf_clear;
+    wire [2:0]  core_ctrl_state;
+    wire [31:0] cnt_busy, cnt_idle, cnt_load_w, cnt_compute, cnt_drain, cnt_done;
+    wire [31:0] cnt_in_stall, cnt_axis_in_bp, cnt_axis_out_bp, cnt_m_wait;
+
     // Core Controls
     wire        core_weight_load_en;  // Phase 2: Array Load
     wire        core_weight_dma_req;  // Phase 1: DMA Request
     wire        core_input_read_en;
+    wire        core_chunk_swap;      // M-Chunk 切换 (Input Buffer Bank Swap)
+    wire        ibuf_tready;
+    wire        ibuf_bank_full;       // 下一 M-Chunk 已就绪
     
     // Data Paths
     wire [`ARRAY_ROW*8-1:0]  ibuf_to_core_data; 
@@ -83,7 +96,7 @@ module deit_accelerator_top #(
     // --- AXI Control ---
     axi_lite_control #(
         .C_S_AXI_DATA_WIDTH(32),
-        .C_S_AXI_ADDR_WIDTH(6) 
+        .C_S_AXI_ADDR_WIDTH(C_S_AXI_ADDR_WIDTH) 
     ) u_control (
         .clk(clk), .rst_n(rst_n),
         .s_axi_awaddr(s_axi_awaddr), .s_axi_awvalid(s_axi_awvalid), .s_axi_awready(s_axi_awready),
@@ -95,18 +108,24 @@ module deit_accelerator_top #(
         .o_cfg_compute_cycles(cfg_seq_len), .o_cfg_acc_mode(cfg_acc_mode),
         .i_ap_done(core_ap_done), .i_ap_idle(core_ap_idle),
         .o_ppu_mult(cfg_ppu_mult), .o_ppu_shift(cfg_ppu_shift),
-        .o_ppu_zp(cfg_ppu_zp), .o_ppu_bias(cfg_ppu_bias), .o_output_en(cfg_output_en)
+        .o_ppu_zp(cfg_ppu_zp), .o_ppu_bias(cfg_ppu_bias), .o_output_en(cfg_output_en),
+        .o_perf_clear(perf_clear),
+        .i_cnt_busy(cnt_busy), .i_cnt_idle(cnt_idle), .i_cnt_load_w(cnt_load_w),
+        .i_cnt_compute(cnt_compute), .i_cnt_drain(cnt_drain), .i_cnt_done(cnt_done),
+        .i_cnt_in_stall(cnt_in_stall), .i_cnt_axis_in_bp(cnt_axis_in_bp), .i_cnt_axis_out_bp(cnt_axis_out_bp),
+        .i_cnt_m_wait(cnt_m_wait)
     );
 
     // --- Demux Logic ---
     wire wbuf_in_valid = axis_in_tvalid & core_weight_dma_req;
     wire ibuf_in_valid = axis_in_tvalid & (!core_weight_dma_req);
     
-    assign axis_in_tready = 1'b1;
+    // Weight 通路始终就绪; Input 通路在写 Bank 满 (Chunk 未被消费) 时反压
+    assign axis_in_tready = core_weight_dma_req ? 1'b1 : ibuf_tready;
 
     // --- Swap Control Signals (Fixed with Reset) ---
     
-    // 1. Input Buffer Swap: Trigger on Start
+    // 1. Input Buffer Swap: Trigger on Start / M-Chunk Switch
     reg ctrl_ap_start_d;
     always @(posedge clk or negedge sys_rst_n) begin
         if (!sys_rst_n) ctrl_ap_start_d <= 0;
@@ -123,18 +142,21 @@ module deit_accelerator_top #(
     wire weight_dma_done_pulse = ~core_weight_dma_req & core_weight_dma_req_d;
 
     // --- Buffers ---
+    localparam IBUF_DEPTH_LOG2 = 8; // 单 Bank 256 行 = 单个 M-Chunk
+
     input_buffer_ctrl #(
-        .DEPTH_LOG2(8) 
+        .DEPTH_LOG2(IBUF_DEPTH_LOG2) 
     ) u_input_buf (
         .clk            (clk), .rst_n(sys_rst_n),
         .s_axis_tdata   (axis_in_tdata), 
         .s_axis_tvalid  (ibuf_in_valid), 
-        .s_axis_tready  (), 
+        .s_axis_tready  (ibuf_tready), 
         .s_axis_tlast   (axis_in_tlast),
         .i_rd_en        (core_input_read_en), 
         .o_array_vec    (ibuf_to_core_data),
         .o_dat_valid    (ibuf_valid_out),    // [Connected]
-        .i_bank_swap    (start_rising_edge) 
+        .i_bank_swap    (start_rising_edge | core_chunk_swap),
+        .o_bank_full    (ibuf_bank_full)
     );
 
     weight_buffer_ctrl u_weight_buf (
@@ -151,7 +173,8 @@ module deit_accelerator_top #(
     // --- Core ---
     deit_core #(
         .LATENCY_CFG(27), // [FIXED] 28 -> 27 to align wr_en with data
-        .ADDR_WIDTH(8)
+        .ADDR_WIDTH(ACC_ADDR_WIDTH),
+        .CHUNK_ROWS(1 << IBUF_DEPTH_LOG2)
     ) u_core (
         .clk                    (clk), .rst_n(sys_rst_n),
         .ap_start               (ctrl_ap_start),
@@ -165,7 +188,10 @@ module deit_accelerator_top #(
         .ctrl_weight_load_en    (core_weight_load_en),
         .ctrl_weight_dma_req    (core_weight_dma_req), 
         .ctrl_input_stream_en   (core_input_read_en),
-        .dbg_acc_wr_en(), .dbg_acc_addr(), .dbg_aligned_col0(), .dbg_aligned_col15(), .dbg_raw_col0()
+        .i_chunk_ready          (ibuf_bank_full),
+        .ctrl_chunk_swap        (core_chunk_swap),
+        .dbg_acc_wr_en(), .dbg_acc_addr(), .dbg_aligned_col0(), .dbg_aligned_col15(), .dbg_raw_col0(),
+        .dbg_ctrl_state         (core_ctrl_state)
     );
 
     // --- PPU ---
@@ -183,8 +209,11 @@ module deit_accelerator_top #(
 
     // --- Output Buffer (FIFO + Gearbox) [NEW] ---
     // 替换了原来脆弱的 reg 状态机
+    // PPU 每拍写 1 行且无法反压，Gearbox 最快 2 拍读 1 行:
+    // 深度必须覆盖单个 Job 的全部输出行 (= Accumulator 深度)，
+    // 这样即使 DMA 在 Job 期间完全停顿也不会丢行。
     output_buffer_ctrl #(
-        .DEPTH_LOG2(8) // 256 Depth for Safety
+        .DEPTH_LOG2(ACC_ADDR_WIDTH)
     ) u_out_buf (
         .clk            (clk),
         .rst_n          (sys_rst_n),
@@ -199,4 +228,28 @@ module deit_accelerator_top #(
         .axis_tlast     (axis_out_tlast)
     );
 
+    // --- Performance Counters [NEW] ---
+    // 使用硬复位 rst_n：软复位 (Soft Reset) 不会清掉计数结果
+    perf_counters u_perf (
+        .clk                (clk),
+        .rst_n              (rst_n),
+        .i_clear            (perf_clear),
+        .i_ctrl_state       (core_ctrl_state),
+        .i_input_valid      (ibuf_valid_out),
+        .i_axis_in_tvalid   (axis_in_tvalid),
+        .i_axis_in_tready   (axis_in_tready),
+        .i_axis_out_tvalid  (axis_out_tvalid),
+        .i_axis_out_tready  (axis_out_tready),
+        .o_cnt_busy         (cnt_busy),
+        .o_cnt_idle         (cnt_idle),
+        .o_cnt_load_w       (cnt_load_w),
+        .o_cnt_compute      (cnt_compute),
+        .o_cnt_drain        (cnt_drain),
+        .o_cnt_done         (cnt_done),
+        .o_cnt_in_stall     (cnt_in_stall),
+        .o_cnt_axis_in_bp   (cnt_axis_in_bp),
+        .o_cnt_axis_out_bp  (cnt_axis_out_bp),
+        .o_cnt_m_wait       (cnt_m_wait)
+    );
+
 endmodule
\ No newline at end of file
@@ -0,0 +1,319 @@
+// -----------------------------------------------------------------------------
+// 文件名: src/deit_accelerator_top_stream_tb.v
+// 描述: DeiT Accelerator 全系统验证 (Streaming 版本)
+//       - 激励不再通过 $readmemh 预读取，而是从命名管道 (FIFO) 中逐拍 $fscanf
+//       - 输出 AXI-Stream 逐拍写入另一个命名管道，由 Python 端实时比对 Golden
+//       - Job 序列 (acc_mode / output_en / 节拍数) 全部由激励流描述，
+//         因此 M/K/N 与 Tile 调度 (含零 Tile 跳过) 都由 Python 决定
+//       - 时序策略与 deit_accelerator_top_tb.v 相同 (预加载 Input, Start 后并行发 Weight)
+//       - 每个 Job 的行数 (<= Accumulator 深度) 由激励流给出，M 更大时 Python 端按组拆分
+//       - M > 256 时输入按 M-Chunk 分块: Chunk 0 预加载，其余 Chunk 在 Weight DMA
+//         结束后发送，每块开头等待 TREADY (Input Buffer 写 Bank 空出)
+//
+// 运行: vvp sim.out +STIM=<stim_fifo> +OUT=<out_fifo> [+VCD]
+//       +VCD: 导出 top_stream_verify.vcd (默认不导出，保持磁盘占用恒定)
+//       结束时打印 [PERF] 计数器，由 simulate_top_stream.sh 交给 perf_counters.py 比对
+//
+// 激励流格式 (每行一个或多个 Hex 字段):
+//   M_DIM    (整个序列的行数，仅用于打印)
+//   NUM_JOBS
+//   CFG_MULT / CFG_SHIFT / CFG_ZP / CFG_BIAS (各一行)
+//   每个 Job: "ACC_MODE OUTPUT_EN ROWS NUM_CHUNKS W_BEATS"，随后:
+//     Chunk 0 节拍数 + 输入节拍, W_BEATS 行权重, Chunk 1..n (各自节拍数 + 输入节拍)
+// -----------------------------------------------------------------------------
+`timescale 1ns / 1ps
+
+module deit_accelerator_top_stream_tb;
+
+    // --- 1. 参数与时钟 ---
+    localparam C_S_AXI_DATA_WIDTH = 32;
+    localparam C_S_AXI_ADDR_WIDTH = 7;
+
+    reg clk, rst_n;
+    always #5 clk = ~clk; // 100MHz
+
+    // --- 2. 接口信号 ---
+    // AXI-Lite
+    reg  [C_S_AXI_ADDR_WIDTH-1:0]  s_axi_awaddr;
+    reg                            s_axi_awvalid;
+    wire                           s_axi_awready;
+    reg  [31:0]                    s_axi_wdata;
+    reg  [3:0]                     s_axi_wstrb;
+    reg                            s_axi_wvalid;
+    wire                           s_axi_wready;
+    wire [1:0]                     s_axi_bresp;
+    wire                           s_axi_bvalid;
+    reg                            s_axi_bready;
+
+    reg  [C_S_AXI_ADDR_WIDTH-1:0]  s_axi_araddr;
+    reg                            s_axi_arvalid;
+    wire                           s_axi_arready;
+    wire [31:0]                    s_axi_rdata;
+    wire [1:0]                     s_axi_rresp;
+    wire                           s_axi_rvalid;
+    reg                            s_axi_rready;
+
+    // AXI-Stream RX (DMA -> FPGA)
+    reg  [63:0] axis_in_tdata;
+    reg         axis_in_tvalid;
+    wire        axis_in_tready;
+    reg         axis_in_tlast;
+
+    // AXI-Stream TX (FPGA -> DMA)
+    wire [63:0] axis_out_tdata;
+    wire        axis_out_tvalid;
+    reg         axis_out_tready;
+    wire        axis_out_tlast;
+
+    // --- 3. DUT 实例化 ---
+    deit_accelerator_top #(
+        .C_S_AXI_ADDR_WIDTH(C_S_AXI_ADDR_WIDTH)
+    ) dut (
+        .clk(clk), .rst_n(rst_n),
+        // Lite
+        .s_axi_awaddr(s_axi_awaddr), .s_axi_awvalid(s_axi_awvalid), .s_axi_awready(s_axi_awready),
+        .s_axi_wdata(s_axi_wdata), .s_axi_wstrb(s_axi_wstrb), .s_axi_wvalid(s_axi_wvalid), .s_axi_wready(s_axi_wready),
+        .s_axi_bresp(s_axi_bresp), .s_axi_bvalid(s_axi_bvalid), .s_axi_bready(s_axi_bready),
+        .s_axi_araddr(s_axi_araddr), .s_axi_arvalid(s_axi_arvalid), .s_axi_arready(s_axi_arready),
+        .s_axi_rdata(s_axi_rdata), .s_axi_rresp(s_axi_rresp), .s_axi_rvalid(s_axi_rvalid), .s_axi_rready(s_axi_rready),
+        // Stream
+        .axis_in_tdata(axis_in_tdata), .axis_in_tvalid(axis_in_tvalid), .axis_in_tready(axis_in_tready), .axis_in_tlast(axis_in_tlast),
+        .axis_out_tdata(axis_out_tdata), .axis_out_tvalid(axis_out_tvalid), .axis_out_tready(axis_out_tready), .axis_out_tlast(axis_out_tlast)
+    );
+
+    // --- 4. 管道句柄 ---
+    reg [1023:0] stim_path;
+    reg [1023:0] out_path;
+    integer fd_stim;
+    integer fd_out;
+    integer scan_ret;
+
+    reg [31:0] m_dim;
+    reg [31:0] num_jobs;
+    reg [31:0] cfg_mult, cfg_shift, cfg_zp, cfg_bias;
+
+    // 当前 Job 描述
+    reg [31:0] job_acc_mode, job_output_en, job_rows, job_num_chunks, job_w_beats;
+    reg [31:0] chunk_beats;
+
+    integer beats_in_total  = 0;
+    integer beats_out_total = 0;
+
+    // 从激励管道读取一个 32-bit Hex 字段 ($fscanf 在管道无数据时阻塞)
+    task read_word;
+        output [31:0] val;
+        begin
+            scan_ret = $fscanf(fd_stim, "%h\n", val);
+            if (scan_ret != 1) begin
+                $display("[FATAL] Stimulus stream ended unexpectedly");
+                $finish;
+            end
+        end
+    endtask
+
+    // --- 5. AXI Helper Tasks ---
+    task axi_lite_write;
+        input [C_S_AXI_ADDR_WIDTH-1:0] addr;
+        input [31:0] data;
+        begin
+            @(posedge clk);
+            s_axi_awaddr <= addr; s_axi_awvalid <= 1;
+            s_axi_wdata <= data; s_axi_wstrb <= 4'hF; s_axi_wvalid <= 1;
+            s_axi_bready <= 1;
+            wait(s_axi_awready && s_axi_wready);
+            @(posedge clk);
+            s_axi_awvalid <= 0; s_axi_wvalid <= 0;
+            wait(s_axi_bvalid);
+            @(posedge clk);
+            s_axi_bready <= 0;
+        end
+    endtask
+
+    task axi_lite_read;
+        input  [C_S_AXI_ADDR_WIDTH-1:0] addr;
+        output [31:0] data;
+        begin
+            @(posedge clk);
+            s_axi_araddr <= addr; s_axi_arvalid <= 1;
+            s_axi_rready <= 1;
+            wait(s_axi_arready);
+            @(posedge clk);
+            s_axi_arvalid <= 0;
+            wait(s_axi_rvalid);
+            data = s_axi_rdata;
+            @(posedge clk);
+            s_axi_rready <= 0;
+        end
+    endtask
+
+    // Performance Counter Dump (格式与 perf_counters.py 的解析规则对应)
+    task dump_perf_counters;
+        reg [31:0] val;
+        begin
+            $display("\n[TB] Performance Counters:");
+            axi_lite_read(7'h2C, val); $display("[PERF] BUSY = %0d", val);
+            axi_lite_read(7'h30, val); $display("[PERF] IDLE = %0d", val);
+            axi_lite_read(7'h34, val); $display("[PERF] LOAD_W = %0d", val);
+            axi_lite_read(7'h38, val); $display("[PERF] COMPUTE = %0d", val);
+            axi_lite_read(7'h3C, val); $display("[PERF] DRAIN = %0d", val);
+            axi_lite_read(7'h40, val); $display("[PERF] DONE = %0d", val);
+            axi_lite_read(7'h44, val); $display("[PERF] IN_STALL = %0d", val);
+            axi_lite_read(7'h48, val); $display("[PERF] AXIS_IN_BP = %0d", val);
+            axi_lite_read(7'h4C, val); $display("[PERF] AXIS_OUT_BP = %0d", val);
+            axi_lite_read(7'h50, val); $display("[PERF] M_WAIT = %0d", val);
+        end
+    endtask
+
+    // DMA Send Task: 逐拍从管道取数据并驱动 AXIS (With TLAST)
+    task send_stream_beats;
+        input integer limit;
+        integer i;
+        reg [63:0] beat;
+        begin
+            // Input Buffer 写 Bank 满时 TREADY 为低，等待上一块被消费
+            while (!axis_in_tready) @(posedge clk);
+            for (i = 0; i < limit; i = i + 1) begin
+                scan_ret = $fscanf(fd_stim, "%h\n", beat);
+                if (scan_ret != 1) begin
+                    $display("[FATAL] Stimulus stream ended inside a burst");
+                    $finish;
+                end
+
+                axis_in_tvalid <= 1;
+                axis_in_tdata  <= beat;
+                if (i == limit - 1) axis_in_tlast <= 1;
+                else                axis_in_tlast <= 0;
+
+                @(posedge clk);
+            end
+            axis_in_tvalid <= 0;
+            axis_in_tlast <= 0;
+            beats_in_total = beats_in_total + limit;
+        end
+    endtask
+
+    // 输出方向: 逐拍写入输出管道，由 Python 端比对
+    task capture_output_stream;
+        integer i;
+        begin
+            axis_out_tready <= 1;
+            for (i = 0; i < job_rows*2; i = i + 1) begin
+                while (!axis_out_tvalid) @(posedge clk);
+                $fwrite(fd_out, "%h\n", axis_out_tdata);
+                @(posedge clk);
+            end
+            $fflush(fd_out);
+            axis_out_tready <= 0;
+            beats_out_total = beats_out_total + job_rows*2;
+        end
+    endtask
+
+    // --- 6. Main Scenario ---
+    integer job;
+    integer chunk;
+
+    initial begin
+        // 波形默认关闭: 全设计 VCD 随仿真时长线性增长，长回归只在需要时 +VCD 打开
+        if ($test$plusargs("VCD")) begin
+            $dumpfile("top_stream_verify.vcd");
+            $dumpvars(0, deit_accelerator_top_stream_tb);
+        end
+
+        clk = 0; rst_n = 0;
+        s_axi_awvalid=0; s_axi_wvalid=0; s_axi_bready=0; s_axi_arvalid=0; s_axi_rready=0;
+        axis_in_tvalid=0; axis_in_tlast=0; axis_out_tready=0;
+        s_axi_awaddr = 0; s_axi_araddr = 0;
+
+        if (!$value$plusargs("STIM=%s", stim_path)) begin
+            $display("[FATAL] Missing +STIM=<fifo>");
+            $finish;
+        end
+        if (!$value$plusargs("OUT=%s", out_path)) begin
+            $display("[FATAL] Missing +OUT=<fifo>");
+            $finish;
+        end
+
+        // 打开顺序与 Python 端一致: 先激励 (读)，后结果 (写)
+        fd_stim = $fopen(stim_path, "r");
+        fd_out  = $fopen(out_path, "w");
+        if (fd_stim == 0 || fd_out == 0) begin
+            $display("[FATAL] Cannot open stream pipes");
+            $finish;
+        end
+
+        // Stream Header
+        read_word(m_dim);
+        read_word(num_jobs);
+        read_word(cfg_mult);
+        read_word(cfg_shift);
+        read_word(cfg_zp);
+        read_word(cfg_bias);
+
+        #20 rst_n = 1;
+        #50;
+
+        $display("=== START SYSTEM TOP VERIFICATION (STREAMING) ===");
+        $display("[TB] M=%0d, Jobs=%0d", m_dim, num_jobs);
+
+        // 1. Config Global & PPU
+        axi_lite_write(7'h00, 2); // 释放软复位
+        axi_lite_write(7'h14, cfg_mult);
+        axi_lite_write(7'h18, cfg_shift);
+        axi_lite_write(7'h1C, cfg_zp);
+        axi_lite_write(7'h20, cfg_bias);
+        axi_lite_write(7'h28, 1); // 清零性能计数器，只统计下面的 Job
+
+        // 2. Job Loop
+        for (job = 0; job < num_jobs; job = job + 1) begin
+            scan_ret = $fscanf(fd_stim, "%h %h %h %h %h\n",
+                               job_acc_mode, job_output_en, job_rows, job_num_chunks, job_w_beats);
+            if (scan_ret != 5) begin
+                $display("[FATAL] Bad job header at job %0d", job);
+                $finish;
+            end
+
+            axi_lite_write(7'h08, job_rows);
+            axi_lite_write(7'h24, job_output_en);
+            axi_lite_write(7'h0C, job_acc_mode);
+
+            // Pre-load Input (Chunk 0)
+            read_word(chunk_beats);
+            send_stream_beats(chunk_beats);
+
+            fork
+                axi_lite_write(7'h00, 3); // Start=1, Rst=1
+                begin
+                    wait(dut.u_control.o_ap_start == 1);
+                    repeat(5) @(posedge clk);
+                    send_stream_beats(job_w_beats);
+
+                    // 剩余 M-Chunk: Weight DMA 窗口结束后才能走 Input 通路
+                    wait(dut.core_weight_dma_req == 0);
+                    @(posedge clk);
+                    for (chunk = 1; chunk < job_num_chunks; chunk = chunk + 1) begin
+                        read_word(chunk_beats);
+                        send_stream_beats(chunk_beats);
+                    end
+                end
+                begin
+                    wait(dut.u_control.o_ap_start == 1);
+                    @(posedge dut.core_ap_done);
+                end
+                begin
+                    if (job_output_en) capture_output_stream();
+                end
+            join
+
+            repeat(10) @(posedge clk);
+        end
+
+        $display("[TB] Streamed %0d input beats, %0d output beats", beats_in_total, beats_out_total);
+        dump_perf_counters();
+        $fclose(fd_out);
+        $fclose(fd_stim);
+
+        $display("\n=== STREAMING DONE: Golden check is performed by the Python side ===\n");
+        $finish;
+    end
+
+endmodule
@@ -4,6 +4,7 @@
 //       - Fix 1: 使用 fork-join 并行发送权重，解决 Controller 盲计数导致的窗口错生问题
 //       - Fix 2: 增加 TLAST 驱动，确保 Buffer 指针复位
 //       - Fix 3: 输入数据 (Input) 在 Start 之前预加载，避免 Compute 阶段无数据
+//       - 结束时读出性能计数器，打印 [PERF] 行供 perf_counters.py 与性能模型比对
 // -----------------------------------------------------------------------------
 `timescale 1ns / 1ps
 
@@ -11,7 +12,7 @@ module deit_accelerator_top_tb;
 
     // --- 1. 参数与时钟 ---
     localparam C_S_AXI_DATA_WIDTH = 32;
-    localparam C_S_AXI_ADDR_WIDTH = 6;
+    localparam C_S_AXI_ADDR_WIDTH = 7;
     
     // Matrix Dims
     localparam M_DIM = 32;
@@ -120,6 +121,41 @@ module deit_accelerator_top_tb;
         end
     endtask
 
+    task axi_lite_read;
+        input  [C_S_AXI_ADDR_WIDTH-1:0] addr;
+        output [31:0] data;
+        begin
+            @(posedge clk);
+            s_axi_araddr <= addr; s_axi_arvalid <= 1;
+            s_axi_rready <= 1;
+            wait(s_axi_arready);
+            @(posedge clk);
+            s_axi_arvalid <= 0;
+            wait(s_axi_rvalid);
+            data = s_axi_rdata;
+            @(posedge clk);
+            s_axi_rready <= 0;
+        end
+    endtask
+
+    // Performance Counter Dump (格式与 perf_counters.py 的解析规则对应)
+    task dump_perf_counters;
+        reg [31:0] val;
+        begin
+            $display("\n[TB] Performance Counters:");
+            axi_lite_read(7'h2C, val); $display("[PERF] BUSY = %0d", val);
+            axi_lite_read(7'h30, val); $display("[PERF] IDLE = %0d", val);
+            axi_lite_read(7'h34, val); $display("[PERF] LOAD_W = %0d", val);
+            axi_lite_read(7'h38, val); $display("[PERF] COMPUTE = %0d", val);
+            axi_lite_read(7'h3C, val); $display("[PERF] DRAIN = %0d", val);
+            axi_lite_read(7'h40, val); $display("[PERF] DONE = %0d", val);
+            axi_lite_read(7'h44, val); $display("[PERF] IN_STALL = %0d", val);
+            axi_lite_read(7'h48, val); $display("[PERF] AXIS_IN_BP = %0d", val);
+            axi_lite_read(7'h4C, val); $display("[PERF] AXIS_OUT_BP = %0d", val);
+            axi_lite_read(7'h50, val); $display("[PERF] M_WAIT = %0d", val);
+        end
+    endtask
+
     // DMA Send Task (With TLAST Fix)
     task send_stream_data;
         input [1:0] type_id; // 0: Weight, 1: Input
@@ -218,6 +254,9 @@ module deit_accelerator_top_tb;
         axi_lite_write(6'h18, file_config[1]); 
         axi_lite_write(6'h1C, file_config[2]); 
         axi_lite_write(6'h20, file_config[3]); // Bias
+
+        // Clear Performance Counters (4 个 Job 之后与性能模型比对)
+        axi_lite_write(7'h28, 1);
         
         // --- LOOP 1: Compute Output Tile N=0 ---
         $display("\n[TB] === Processing Output Tile N=0 ===");
@@ -310,6 +349,8 @@ module deit_accelerator_top_tb;
         
         #200;
 
+        dump_perf_counters();
+
         if (err_cnt == 0) $display("\n=== SUCCESS: Full System Verified! ===\n");
         else $display("\n=== FAILURE: Found %0d Errors ===\n", err_cnt);
         
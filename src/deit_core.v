@@ -1,7 +1,9 @@
 // -----------------------------------------------------------------------------
 // 文件名: src/deit_core.v
-// 版本: 1.2 (Address Width Expansion)
-// 描述: 核心计算逻辑，已升级累加器地址位宽至 8-bit (支持 M=197)
+// 版本: 1.3 (Chained M-Chunks)
+// 描述: 核心计算逻辑，累加器地址位宽参数化 (ADDR_WIDTH)
+//       - M 可超过 Input Buffer 深度: Controller 按 CHUNK_ROWS 分块切换 Bank，
+//         累加器地址在整个 Job 内连续递增 (ap_start 时清零)
 // -----------------------------------------------------------------------------
 
 `timescale 1ns / 1ps
@@ -9,7 +11,8 @@
 
 module deit_core #(
     parameter LATENCY_CFG = 28,
-    parameter ADDR_WIDTH  = 8 // NEW: Address Width Parameter
+    parameter ADDR_WIDTH  = 8,  // NEW: Address Width Parameter
+    parameter CHUNK_ROWS  = 256 // Input Buffer 单 Bank 深度
 )(
     input  wire                         clk,
     input  wire                         rst_n,
@@ -34,13 +37,16 @@ module deit_core #(
     output wire                         ctrl_weight_load_en,
     output wire                         ctrl_weight_dma_req, // [NEW]
     output wire                         ctrl_input_stream_en,
+    input  wire                         i_chunk_ready,   // [NEW] 下一 M-Chunk 已写满
+    output wire                         ctrl_chunk_swap, // [NEW] 切换 Input Buffer Bank
 
     // --- DEBUG PORTS (Updated Width) ---
     output wire                         dbg_acc_wr_en,
     output wire [ADDR_WIDTH-1:0]        dbg_acc_addr, // Expanded
     output wire [`ACC_WIDTH-1:0]        dbg_aligned_col0,
     output wire [`ACC_WIDTH-1:0]        dbg_aligned_col15,
-    output wire [`ACC_WIDTH-1:0]        dbg_raw_col0
+    output wire [`ACC_WIDTH-1:0]        dbg_raw_col0,
+    output wire [2:0]                   dbg_ctrl_state  // [NEW] 供性能计数器使用
 );
 
     // =========================================================================
@@ -49,7 +55,8 @@ module deit_core #(
     wire ctrl_drain_en_unused;
     
     global_controller #(
-        .LATENCY(LATENCY_CFG)
+        .LATENCY(LATENCY_CFG),
+        .CHUNK_ROWS(CHUNK_ROWS)
     ) u_controller (
         .clk                    (clk),
         .rst_n                  (rst_n),
@@ -57,13 +64,15 @@ module deit_core #(
         .cfg_seq_len            (cfg_compute_cycles),
         .ap_done                (ap_done),
         .ap_idle                (ap_idle),
-        .current_state_dbg      (),
+        .current_state_dbg      (dbg_ctrl_state),
         .ctrl_weight_dma_req    (ctrl_weight_dma_req), // [NEW]
         .i_weight_valid (i_weight_valid), // 连接到 Controller
         .i_input_valid          (i_input_valid),    // [Connect if available]
         .ctrl_weight_load_en    (ctrl_weight_load_en),
         .ctrl_input_stream_en   (ctrl_input_stream_en),
-        .ctrl_drain_en          (ctrl_drain_en_unused)
+        .ctrl_drain_en          (ctrl_drain_en_unused),
+        .i_chunk_ready          (i_chunk_ready),
+        .ctrl_chunk_swap        (ctrl_chunk_swap)
     );
 
     // =========================================================================
@@ -202,14 +211,16 @@ module deit_core #(
     // Change reg width from 3:0 to ADDR_WIDTH-1:0
     reg [ADDR_WIDTH-1:0] acc_addr; 
     
+    // [MOD] 不再在 wr_en 间隙复位: M-Chunk 之间存在写使能空档，
+    //       地址需在整个 Job 内连续，仅在 ap_start 时归零。
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
             acc_addr <= 0;
         end else begin
-            if (acc_wr_en) begin
+            if (ap_start) begin
+                acc_addr <= 0;
+            end else if (acc_wr_en) begin
                 acc_addr <= acc_addr + 1;
-            end else  begin
-                acc_addr <= 0; 
             end
         end
     end
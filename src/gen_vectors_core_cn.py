@@ -1,6 +1,8 @@
 import numpy as np
 import os
 
+from golden_gemm import golden_matmul
+
 # ==============================================================================
 # 1. 实验配置
 # ==============================================================================
@@ -39,7 +41,7 @@ def generate_core_vectors():
     mat_b = np.random.randint(-5, 5, size=(K_DIM, N_DIM), dtype=np.int8)
 
     # 2. 计算标准答案 (Golden)
-    mat_c_golden = np.matmul(mat_a.astype(np.int32), mat_b.astype(np.int32))
+    mat_c_golden = golden_matmul(mat_a, mat_b)
 
     # 3. 计算切分数量
     # K 维度切分: 24 / 12 = 2 块
@@ -1,6 +1,8 @@
 import numpy as np
 import os
 
+from golden_gemm import golden_matmul
+
 def generate_test_data():
     os.makedirs('src/test_data_core', exist_ok=True)
     
@@ -26,7 +28,7 @@ def generate_test_data():
     weights_full = np.random.randint(-8, 8, size=(K, N)).astype(np.int8)
     
     # 2. Golden Calculation
-    golden_full = np.dot(inputs_full, weights_full).astype(np.int32)
+    golden_full = golden_matmul(inputs_full, weights_full)
     
     # 3. Slicing & Saving (The "Four Matrices" Strategy)
     
@@ -1,6 +1,8 @@
 import numpy as np
 import os
 
+from golden_gemm import golden_matmul
+
 # --- 配置参数 ---
 SEQ_LEN = 32      # 输入序列长度
 ARRAY_ROW = 12    # 物理阵列行数 (Inputs/Activations)
@@ -37,7 +39,7 @@ def generate_files():
     # 3. 计算 Golden Output
     # 矩阵乘法: (32, 12) x (12, 16) = (32, 16)
     # 结果累加到 32-bit，不会溢出
-    golden_output = np.matmul(inputs.astype(np.int32), weights.astype(np.int32))
+    golden_output = golden_matmul(inputs, weights)
 
     # --- 写入文件 (注意: Hex 字符串最右侧对应 Verilog 的 [7:0] / Index 0) ---
 
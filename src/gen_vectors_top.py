@@ -1,6 +1,8 @@
 import numpy as np
 import os
 
+from golden_gemm import golden_matmul
+
 # ==============================================================================
 # 1. 系统配置
 # ==============================================================================
@@ -58,7 +60,7 @@ def generate_system_vectors():
     mat_b = np.random.randint(-10, 10, size=(K_DIM, N_DIM), dtype=np.int8)
     
     # 2. 计算理想结果 (INT32)
-    mat_c_int32 = np.matmul(mat_a.astype(np.int32), mat_b.astype(np.int32))
+    mat_c_int32 = golden_matmul(mat_a, mat_b)
 
     # 初始化累加器状态矩阵
     accumulator_state = np.zeros_like(mat_c_int32, dtype=np.int32)
@@ -103,7 +105,7 @@ def generate_system_vectors():
                     f.write(f"{hex_str}\n")
             
             # 计算中间乘法结果 (INT32)
-            intermediate_result = np.matmul(a_sub.astype(np.int32), b_sub.astype(np.int32))  # M x ARRAY_COL (32 x 16)
+            intermediate_result = golden_matmul(a_sub, b_sub)  # M x ARRAY_COL (32 x 16)
             
             # 保存中间乘法结果到文件 (参考 systolic_array 格式)
             # 每一行包含T时刻流出的16个Column的结果，位宽: ARRAY_COL * 32 = 512 bits
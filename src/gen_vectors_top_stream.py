@@ -0,0 +1,189 @@
+import numpy as np
+import os
+import queue
+import sys
+import threading
+
+from golden_gemm import golden_matmul
+from tile_scheduler import (ARRAY_ROW, ARRAY_COL, BEATS_PER_W_ROW, CHUNK_ROWS, MAX_SEQ_LEN,
+                            build_schedule, chunk_rows, input_beats, pad_to_array, prune_tiles,
+                            seq_groups, weight_tile)
+
+# ==============================================================================
+# 1. 系统配置
+# ==============================================================================
+# 用法: python src/gen_vectors_top_stream.py <stim_fifo> <out_fifo> [M] [K] [N]
+#   - stim_fifo: Python 写, deit_accelerator_top_stream_tb.v 用 $fscanf 读
+#   - out_fifo : TB 写 AXIS 输出, Python 读并与 Golden 实时比对
+# 与 gen_vectors_top.py 不同，这里不落盘任何 .mem 文件，生成与仿真并行进行。
+# M 任意: 每个 Job 最多 MAX_SEQ_LEN 行 (Accumulator 深度)，更长的序列按组重放调度表；
+#         Job 内超过 Input Buffer 深度的部分按 CHUNK_ROWS 行分块发送 (M-Chunk Chaining)。
+M_DIM = 32
+K_DIM = 24
+N_DIM = 32
+
+PRUNE_RATIO = 0.0   # >0 时按 Tile 随机置零，覆盖零 Tile 跳过路径
+
+# --- PPU 量化参数 (与 gen_vectors_top.py 相同) ---
+CFG_BIAS  = 100
+CFG_MULT  = 180
+CFG_SHIFT = 8
+CFG_ZP    = 10
+
+# ==============================================================================
+# 2. 辅助函数
+# ==============================================================================
+def ppu_software_model_vec(acc):
+    """向量化版 PPU 模型: Clamp( ((In + Bias) * Mult >> Shift) + ZP )"""
+    val = (acc.astype(np.int64) + CFG_BIAS) * CFG_MULT
+    val = (val >> CFG_SHIFT) + CFG_ZP
+    return np.clip(val, -128, 127).astype(np.int8)
+
+def bytes_to_beats(byte_arr):
+    """INT8 字节流 -> 64-bit 节拍 (低字节在低位，不足 8 字节补零)"""
+    raw = np.ascontiguousarray(byte_arr, dtype=np.int8).tobytes()
+    if len(raw) % 8:
+        raw += b"\x00" * (8 - len(raw) % 8)
+    return [f"{int(v):016x}" for v in np.frombuffer(raw, dtype="<u8")]
+
+def input_tile_beats(a_pad, k_idx):
+    """M x 12 输入 -> 每个 M-Chunk 一组 Input Buffer Gearbox (3x64 -> 2x96) 节拍序列"""
+    k0 = k_idx * ARRAY_ROW
+    chunks, r0 = [], 0
+    for rows in chunk_rows(a_pad.shape[0]):
+        chunks.append(bytes_to_beats(a_pad[r0 : r0 + rows, k0 : k0 + ARRAY_ROW]))
+        r0 += rows
+    return chunks
+
+def weight_tile_beats(b_pad, tile):
+    """12 x 16 权重 -> 每行 128-bit 拆成 Low/High 两拍，只发送前 w_rows 行"""
+    w = weight_tile(b_pad, tile.k_idx, tile.n_idx)
+    return bytes_to_beats(w[: tile.w_rows, :])
+
+def output_tile_beats(c_int8, n_idx):
+    """M x 16 INT8 结果 -> Output Gearbox (128 -> 2x64, Low first)"""
+    c0 = n_idx * ARRAY_COL
+    return bytes_to_beats(c_int8[:, c0 : c0 + ARRAY_COL])
+
+# ==============================================================================
+# 3. 激励写入线程 (Python -> TB)
+# ==============================================================================
+def stream_stimulus(stim_path, a_pad, b_pad, schedule, golden_q, writer_err):
+    """写激励并生成 Golden; 异常 (断言 / TB 退出后的 BrokenPipeError) 记入 writer_err，
+    并保证放入结束标记，避免比对端永久阻塞"""
+    try:
+        m_dim = a_pad.shape[0]
+        groups = seq_groups(m_dim)
+
+        with open(stim_path, "w") as f:
+            f.write(f"{m_dim:08x}\n{len(schedule) * len(groups):08x}\n")
+            f.write(f"{CFG_MULT:08x}\n{CFG_SHIFT:08x}\n{CFG_ZP:08x}\n{CFG_BIAS:08x}\n")
+            f.flush()
+
+            for r0, rows in groups:
+                a_grp = a_pad[r0 : r0 + rows]
+                acc = np.zeros((rows, ARRAY_COL), dtype=np.int64)
+
+                for tile in schedule:
+                    in_chunks = input_tile_beats(a_grp, tile.k_idx)
+                    w_beats = weight_tile_beats(b_pad, tile)
+                    assert sum(len(c) for c in in_chunks) == input_beats(rows)
+                    assert len(w_beats) == tile.w_rows * BEATS_PER_W_ROW
+
+                    # 顺序与 TB 一致: Chunk 0 (预加载) -> Weight -> Chunk 1..n (计算中写入另一 Bank)
+                    f.write(f"{tile.acc_mode:x} {tile.output_en:x} {rows:x} "
+                            f"{len(in_chunks):x} {len(w_beats):x}\n")
+                    f.write(f"{len(in_chunks[0]):x}\n" + "\n".join(in_chunks[0]) + "\n")
+                    f.write("\n".join(w_beats) + "\n")
+                    for beats in in_chunks[1:]:
+                        f.write(f"{len(beats):x}\n" + "\n".join(beats) + "\n")
+                    f.flush()
+
+                    # Golden 与激励同步生成: 列完成时交给比对端
+                    k0, c0 = tile.k_idx * ARRAY_ROW, tile.n_idx * ARRAY_COL
+                    psum = golden_matmul(a_grp[:, k0 : k0 + ARRAY_ROW],
+                                         b_pad[k0 : k0 + ARRAY_ROW, c0 : c0 + ARRAY_COL], np.int64)
+                    acc = acc + psum if tile.acc_mode else psum
+                    if tile.output_en:
+                        label = f"M[{r0}:{r0 + rows}] N={tile.n_idx}"
+                        golden_q.put((label, output_tile_beats(ppu_software_model_vec(acc), 0)))
+    except Exception as e:
+        writer_err.append(e)
+    finally:
+        golden_q.put(None)
+
+# ==============================================================================
+# 4. 结果比对 (TB -> Python)
+# ==============================================================================
+def check_output_stream(out_path, golden_q):
+    err_cnt = 0
+    beat_cnt = 0
+    with open(out_path, "r") as f:
+        while True:
+            item = golden_q.get()
+            if item is None:
+                break
+            label, expected = item
+            for i, exp in enumerate(expected):
+                line = f.readline()
+                if not line:
+                    print(f"[FAIL] Output stream closed early ({label}, Word {i})")
+                    return err_cnt + 1, beat_cnt
+                got = line.strip().lower()
+                beat_cnt += 1
+                if got != exp:
+                    print(f"[FAIL] {label} Word {i}: Exp {exp}, Got {got}")
+                    err_cnt += 1
+            print(f"  [CHECK] Output Tile {label} done")
+    return err_cnt, beat_cnt
+
+# ==============================================================================
+# 5. 主流程
+# ==============================================================================
+def run_stream(stim_path, out_path, m_dim, k_dim, n_dim):
+    print("=== Streaming Top-Level Vectors ===")
+    print(f"矩阵: [{m_dim}x{k_dim}] * [{k_dim}x{n_dim}] -> PPU -> INT8")
+    groups = seq_groups(m_dim)
+    if len(groups) > 1:
+        print(f"  M > {MAX_SEQ_LEN}: 拆分为 {len(groups)} 组，每组重放一次调度表")
+    if m_dim > CHUNK_ROWS:
+        print(f"  M-Chunk Chaining: 每 Job 最多 {len(chunk_rows(groups[0][1]))} Chunks")
+
+    mat_a = np.random.randint(-10, 10, size=(m_dim, k_dim), dtype=np.int8)
+    mat_b = np.random.randint(-10, 10, size=(k_dim, n_dim), dtype=np.int8)
+    if PRUNE_RATIO > 0:
+        mat_b = prune_tiles(mat_b, PRUNE_RATIO, np.random.default_rng())
+
+    a_pad, b_pad = pad_to_array(mat_a, mat_b)
+    schedule = build_schedule(k_dim, n_dim, mat_b)
+    print(f"  调度: {len(schedule)} Tiles x {len(groups)} 组 = {len(schedule) * len(groups)} Jobs")
+
+    golden_q = queue.Queue()
+    writer_err = []
+    writer = threading.Thread(target=stream_stimulus,
+                              args=(stim_path, a_pad, b_pad, schedule, golden_q, writer_err))
+    writer.start()
+    err_cnt, beat_cnt = check_output_stream(out_path, golden_q)
+    writer.join()
+
+    for e in writer_err:
+        print(f"[FAIL] Stimulus writer: {type(e).__name__}: {e}")
+        err_cnt += 1
+
+    if err_cnt == 0:
+        print(f"✅ Streaming check passed ({beat_cnt} output beats)")
+    else:
+        print(f"❌ Streaming check found {err_cnt} errors")
+    return err_cnt
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python src/gen_vectors_top_stream.py <stim_fifo> <out_fifo> [M] [K] [N]")
+        sys.exit(1)
+    m_dim = int(sys.argv[3]) if len(sys.argv) > 3 else M_DIM
+    k_dim = int(sys.argv[4]) if len(sys.argv) > 4 else K_DIM
+    n_dim = int(sys.argv[5]) if len(sys.argv) > 5 else N_DIM
+    for path in sys.argv[1:3]:
+        if not os.path.exists(path):
+            os.mkfifo(path)
+    sys.exit(1 if run_stream(sys.argv[1], sys.argv[2], m_dim, k_dim, n_dim) else 0)
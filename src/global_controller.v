@@ -1,10 +1,17 @@
 // -----------------------------------------------------------------------------
-// 版本: 3.3 (Fix: Added Input Stream Handshake for Gearbox Latency)
+// 版本: 3.4 (Chained M-Chunk Execution)
+//       - cfg_seq_len 可超过 Input Buffer 单 Bank 深度 (CHUNK_ROWS)。
+//         每 CHUNK_ROWS 行进入 S_M_WAIT，等待 Host 填满另一 Bank 后
+//         发出 ctrl_chunk_swap，复用驻留在阵列中的权重继续计算下一块。
+//         上一块的结果在流水线中继续写回 Accumulator，与下一块的输入重叠。
+//       - ctrl_input_stream_en 在离开 COMPUTE 的同一拍撤销，
+//         Core 只接收 cfg_seq_len 行 (此前会多收 1 行)。
 // -----------------------------------------------------------------------------
 `timescale 1ns / 1ps
 
 module global_controller #(
-    parameter LATENCY = 28
+    parameter LATENCY    = 28,
+    parameter CHUNK_ROWS = 256  // Input Buffer 单 Bank 深度
 )(
     input  wire         clk,
     input  wire         rst_n,
@@ -29,7 +36,11 @@ module global_controller #(
     input  wire         i_input_valid,        // [ADD] 新增端口
 
     output reg          ctrl_input_stream_en, 
-    output reg          ctrl_drain_en
+    output reg          ctrl_drain_en,
+
+    // [NEW] M-Chunk Chaining
+    input  wire         i_chunk_ready,        // Input Buffer 写 Bank 已收到 TLAST
+    output reg          ctrl_chunk_swap       // Pulse: 切换 Input Buffer Bank
 );
 
     localparam S_IDLE     = 3'd0;
@@ -37,10 +48,12 @@ module global_controller #(
     localparam S_COMPUTE  = 3'd2;
     localparam S_DRAIN    = 3'd3;
     localparam S_DONE     = 3'd4;
+    localparam S_M_WAIT   = 3'd5; // [NEW] 等待下一个 M-Chunk
 
     reg [2:0] state, next_state;
     reg [31:0] cnt_load;
     reg [31:0] cnt_seq;
+    reg [31:0] cnt_chunk; // 当前 M-Chunk 内已计算的行数
     reg [31:0] cnt_drain;
 
     // Phase 1 (27cyc) + Phase 2 (12cyc) = 39 cycles total
@@ -64,7 +77,14 @@ module global_controller #(
             
             // [MOD] S_COMPUTE Transition
             // 只有当 cnt_seq (有效计算计数) 达到目标长度时才跳转
-            S_COMPUTE: if (cnt_seq >= cfg_seq_len - 1) next_state = S_DRAIN;
+            // 以 i_input_valid 限定: 新 Chunk 开头的等待拍不会被误判为最后一行
+            S_COMPUTE: if (i_input_valid) begin
+                if (cnt_seq >= cfg_seq_len - 1)         next_state = S_DRAIN;
+                else if (cnt_chunk >= CHUNK_ROWS - 1)   next_state = S_M_WAIT;
+            end
+
+            // [NEW] 旧 Bank 的 Valid 尾巴排空，且新 Bank 已就绪后再切换
+            S_M_WAIT:  if (!i_input_valid && i_chunk_ready) next_state = S_COMPUTE;
             
             S_DRAIN:   if (cnt_drain >= LATENCY - 1) next_state = S_DONE;
             S_DONE:    next_state = S_IDLE;
@@ -79,20 +99,22 @@ module global_controller #(
             ctrl_weight_load_en  <= 0;
             ctrl_input_stream_en <= 0;
             ctrl_drain_en        <= 0;
+            ctrl_chunk_swap      <= 0;
             ap_done <= 0; ap_idle <= 1;
-            cnt_load <= 0; cnt_seq <= 0; cnt_drain <= 0;
+            cnt_load <= 0; cnt_seq <= 0; cnt_drain <= 0; cnt_chunk <= 0;
         end else begin
             // Defaults
             ctrl_weight_dma_req  <= 0;
             ctrl_weight_load_en  <= 0;
             ctrl_input_stream_en <= 0;
             ctrl_drain_en        <= 0;
+            ctrl_chunk_swap      <= 0;
             ap_done <= 0; ap_idle <= 0;
 
             case (state)
                 S_IDLE: begin
                     ap_idle <= 1;
-                    cnt_load <= 0; cnt_seq <= 0; cnt_drain <= 0;
+                    cnt_load <= 0; cnt_seq <= 0; cnt_drain <= 0; cnt_chunk <= 0;
                 end
                 
                 S_LOAD_W: begin
@@ -114,17 +136,26 @@ module global_controller #(
                 S_COMPUTE: begin
                     // 1. 持续向 Input Buffer 发出读请求
                     // 即使数据还没准备好，我们也要一直请求，直到 Buffer 吐出数据
-                    ctrl_input_stream_en <= 1;
+                    // [FIX] 最后一拍即撤销请求，Core 侧 (stream_en & valid) 恰好 M 行
+                    ctrl_input_stream_en <= (next_state == S_COMPUTE);
                     
                     // 2. [FIX] Input Handshake Mechanism:
                     // 只有当 Input Buffer 说数据有效 (Gearbox 延迟已过) 时，
                     // 我们才推进 Sequence Counter。
                     if (i_input_valid) begin
-                        cnt_seq <= cnt_seq + 1;
+                        cnt_seq   <= cnt_seq + 1;
+                        cnt_chunk <= cnt_chunk + 1;
                     end
                     // 否则 cnt_seq 暂停 (Freeze)，防止 Core 吃进无效数据
                 end
                 
+                S_M_WAIT: begin
+                    if (next_state == S_COMPUTE) begin
+                        ctrl_chunk_swap <= 1;
+                        cnt_chunk <= 0;
+                    end
+                end
+
                 S_DRAIN: begin
                     ctrl_drain_en <= 1;
                     cnt_drain <= cnt_drain + 1;
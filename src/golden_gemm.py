@@ -0,0 +1,70 @@
+import numpy as np
+
+# ==============================================================================
+# Exact INT GEMM via BLAS (Golden Model 加速)
+# ==============================================================================
+# NumPy 的整数 matmul 不走 BLAS，DeiT 尺寸下比浮点 matmul 慢一个数量级以上。
+# 浮点数在 |x| <= 2^(mantissa+1) 范围内可以精确表示所有整数；只要每个部分和
+# 的绝对值都不超过该界限，BLAS 的任意累加顺序 (含 FMA) 都不会产生舍入:
+#
+#     |C[i,j]| <= K * max|A| * max|B|
+#
+# INT8 x INT8: max|A| * max|B| = 128 * 128 = 2^14
+#   - float32 (2^24): K <= 1024 时精确
+#   - float64 (2^53): K <= 2^39 时精确 (实际上总是成立)
+# 超出界限时沿 K 切分为若干精确的块，块结果转 int64 后相加；
+# 单个乘积都超出 float64 精度时退回 int64 matmul。
+
+FP32_EXACT_LIMIT = 1 << 24
+FP64_EXACT_LIMIT = 1 << 53
+
+def _max_abs(x):
+    if x.dtype == np.int8:
+        return 128
+    if x.size == 0:
+        return 0
+    return max(-int(x.min()), int(x.max()))
+
+def select_path(k_dim, a_max, b_max):
+    """
+    根据累加界限选择计算路径。
+    返回 (path, k_chunk)，path 为 'fp32' / 'fp64' / 'fp64_chunked' / 'int64'。
+    """
+    term = a_max * b_max
+    if term == 0 or k_dim * term <= FP32_EXACT_LIMIT:
+        return "fp32", k_dim
+    if k_dim * term <= FP64_EXACT_LIMIT:
+        return "fp64", k_dim
+    k_chunk = FP64_EXACT_LIMIT // term
+    if k_chunk >= 1:
+        return "fp64_chunked", k_chunk
+    return "int64", k_dim
+
+def golden_matmul(mat_a, mat_b, out_dtype=np.int32):
+    """
+    精确整数矩阵乘: 结果与 np.matmul(a.astype(int64), b.astype(int64)) 逐位一致。
+    支持 np.matmul 的广播语义 (..., M, K) x (..., K, N)。
+    """
+    mat_a = np.asarray(mat_a)
+    mat_b = np.asarray(mat_b)
+    if not (np.issubdtype(mat_a.dtype, np.integer) and np.issubdtype(mat_b.dtype, np.integer)):
+        raise TypeError(f"golden_matmul expects integer inputs, got {mat_a.dtype} x {mat_b.dtype}")
+
+    k_dim = mat_a.shape[-1]
+    path, k_chunk = select_path(k_dim, _max_abs(mat_a), _max_abs(mat_b))
+
+    if path == "fp32":
+        res = np.matmul(mat_a.astype(np.float32), mat_b.astype(np.float32))
+    elif path == "fp64":
+        res = np.matmul(mat_a.astype(np.float64), mat_b.astype(np.float64))
+    elif path == "fp64_chunked":
+        res = None
+        for k0 in range(0, k_dim, k_chunk):
+            part = np.matmul(mat_a[..., k0 : k0 + k_chunk].astype(np.float64),
+                             mat_b[..., k0 : k0 + k_chunk, :].astype(np.float64))
+            part = part.astype(np.int64)
+            res = part if res is None else res + part
+    else:
+        res = np.matmul(mat_a.astype(np.int64), mat_b.astype(np.int64))
+
+    return res.astype(out_dtype)
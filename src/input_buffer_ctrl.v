@@ -1,6 +1,7 @@
 // -----------------------------------------------------------------------------
 // ļ: src/input_buffer_ctrl.v
 // ޸: Phase 5 Final Fix - Pipeline Alignment & Zero Init (Input Buffer)
+//       M-Chunk Chaining - д Bank յ TLAST ѹֱһ Bank Swap
 // -----------------------------------------------------------------------------
 
 `timescale 1ns / 1ps
@@ -27,7 +28,8 @@ module input_buffer_ctrl #(
     output reg                    o_dat_valid,
 
     // Control
-    input  wire                   i_bank_swap
+    input  wire                   i_bank_swap,
+    output wire                   o_bank_full   // [NEW] д Bank յ Chunk (TLAST)
 );
 
     // -------------------------------------------------------------------------
@@ -52,7 +54,16 @@ module input_buffer_ctrl #(
 
     reg [63:0] temp_reg;
 
-    assign s_axis_tready = 1'b1; 
+    // [NEW] д Bank ־: TLAST ֹ֮ͣգֹδߵ
+    reg wr_full;
+    assign s_axis_tready = !wr_full;
+    assign o_bank_full   = wr_full;
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) wr_full <= 0;
+        else if (i_bank_swap) wr_full <= 0;
+        else if (s_axis_tvalid && s_axis_tready && s_axis_tlast) wr_full <= 1;
+    end
 
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
@@ -69,7 +80,7 @@ module input_buffer_ctrl #(
                 wr_ptr   <= 0;
                 gb_state <= 0;
             end 
-            else if (s_axis_tvalid) begin
+            else if (s_axis_tvalid && s_axis_tready) begin
                 case (gb_state)
                     0: begin 
                         // Word 1: Store only
@@ -0,0 +1,94 @@
+// -----------------------------------------------------------------------------
+// 文件名: src/perf_counters.v
+// 描述: 硬件性能计数器 (Free-Running, 32-bit)
+//       - Busy 周期 (Controller 不在 IDLE)
+//       - global_controller 各状态停留周期
+//       - COMPUTE 阶段 Input Valid 缺失 (Stall) 周期
+//       - M_WAIT: 两个 M-Chunk 之间等待 Input Buffer 换 Bank 的周期
+//       - AXI-Stream 输入/输出反压周期 (TVALID && !TREADY)
+//       - 通过 i_clear 脉冲统一清零，仅受硬复位 rst_n 影响 (不受软复位影响)
+// -----------------------------------------------------------------------------
+
+`timescale 1ns / 1ps
+
+module perf_counters (
+    input  wire         clk,
+    input  wire         rst_n,
+    input  wire         i_clear,
+
+    // --- Probes ---
+    input  wire [2:0]   i_ctrl_state,      // global_controller.current_state_dbg
+    input  wire         i_input_valid,     // Input Buffer o_dat_valid
+    input  wire         i_axis_in_tvalid,
+    input  wire         i_axis_in_tready,
+    input  wire         i_axis_out_tvalid,
+    input  wire         i_axis_out_tready,
+
+    // --- Counters ---
+    output reg  [31:0]  o_cnt_busy,
+    output reg  [31:0]  o_cnt_idle,
+    output reg  [31:0]  o_cnt_load_w,
+    output reg  [31:0]  o_cnt_compute,
+    output reg  [31:0]  o_cnt_drain,
+    output reg  [31:0]  o_cnt_done,
+    output reg  [31:0]  o_cnt_in_stall,
+    output reg  [31:0]  o_cnt_axis_in_bp,
+    output reg  [31:0]  o_cnt_axis_out_bp,
+    output reg  [31:0]  o_cnt_m_wait
+);
+
+    // 与 global_controller.v 的状态编码保持一致
+    localparam S_IDLE     = 3'd0;
+    localparam S_LOAD_W   = 3'd1;
+    localparam S_COMPUTE  = 3'd2;
+    localparam S_DRAIN    = 3'd3;
+    localparam S_DONE     = 3'd4;
+    localparam S_M_WAIT   = 3'd5;
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            o_cnt_busy        <= 0;
+            o_cnt_idle        <= 0;
+            o_cnt_load_w      <= 0;
+            o_cnt_compute     <= 0;
+            o_cnt_drain       <= 0;
+            o_cnt_done        <= 0;
+            o_cnt_in_stall    <= 0;
+            o_cnt_axis_in_bp  <= 0;
+            o_cnt_axis_out_bp <= 0;
+            o_cnt_m_wait      <= 0;
+        end else if (i_clear) begin
+            o_cnt_busy        <= 0;
+            o_cnt_idle        <= 0;
+            o_cnt_load_w      <= 0;
+            o_cnt_compute     <= 0;
+            o_cnt_drain       <= 0;
+            o_cnt_done        <= 0;
+            o_cnt_in_stall    <= 0;
+            o_cnt_axis_in_bp  <= 0;
+            o_cnt_axis_out_bp <= 0;
+            o_cnt_m_wait      <= 0;
+        end else begin
+            if (i_ctrl_state != S_IDLE) o_cnt_busy <= o_cnt_busy + 1;
+
+            case (i_ctrl_state)
+                S_IDLE:    o_cnt_idle    <= o_cnt_idle + 1;
+                S_LOAD_W:  o_cnt_load_w  <= o_cnt_load_w + 1;
+                S_COMPUTE: o_cnt_compute <= o_cnt_compute + 1;
+                S_DRAIN:   o_cnt_drain   <= o_cnt_drain + 1;
+                S_DONE:    o_cnt_done    <= o_cnt_done + 1;
+                S_M_WAIT:  o_cnt_m_wait  <= o_cnt_m_wait + 1;
+            endcase
+
+            // Stall: Controller 在 COMPUTE 中，但 Input Buffer 没有给出有效数据
+            if (i_ctrl_state == S_COMPUTE && !i_input_valid)
+                o_cnt_in_stall <= o_cnt_in_stall + 1;
+
+            if (i_axis_in_tvalid && !i_axis_in_tready)
+                o_cnt_axis_in_bp <= o_cnt_axis_in_bp + 1;
+            if (i_axis_out_tvalid && !i_axis_out_tready)
+                o_cnt_axis_out_bp <= o_cnt_axis_out_bp + 1;
+        end
+    end
+
+endmodule
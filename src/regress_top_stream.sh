@@ -0,0 +1,33 @@
+#!/bin/bash
+# -----------------------------------------------------------------------------
+# Script: regress_top_stream.sh
+# 描述: 顶层 Streaming 回归，覆盖不同 M 下的 Input Buffer / Controller 路径
+#       每个形状调用 simulate_top_stream.sh (Golden 比对 + 性能计数器比对)
+# 用法: bash src/regress_top_stream.sh
+# -----------------------------------------------------------------------------
+
+# "M K N"
+SHAPES=(
+    "32 24 32"     # 单 Chunk (M < Input Buffer 深度)
+    "256 24 32"    # 恰好一个满 Chunk，不进入 M_WAIT
+    "300 24 32"    # 2 Chunks / Job: S_M_WAIT + Bank Swap + TREADY 反压
+    "512 13 17"    # Accumulator / Output FIFO 满深度，K/N 非对齐
+    "600 24 20"    # M > 512: 按组拆分为 2 组 Job
+)
+
+FAILED=()
+for shape in "${SHAPES[@]}"; do
+    echo "=================================================================="
+    echo "[REGRESS] M K N = ${shape}"
+    echo "=================================================================="
+    bash src/simulate_top_stream.sh ${shape}
+    if [ $? -ne 0 ]; then
+        FAILED+=("${shape}")
+    fi
+done
+
+if [ ${#FAILED[@]} -ne 0 ]; then
+    echo "❌ Regression Failed: ${FAILED[*]}"
+    exit 1
+fi
+echo "✅ Streaming Regression Passed (${#SHAPES[@]} shapes)."
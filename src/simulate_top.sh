@@ -8,6 +8,7 @@ MODULE="deit_accelerator_top"
 TB_MODULE="${MODULE}_tb"
 SIM_OUT="src/${MODULE}_sim.out"
 VCD_FILE="top_verify.vcd"
+SIM_LOG="src/top_sim.log"
 # 在Git Bash中初始化conda
 eval "$(G:/anaconda/Scripts/conda.exe 'shell.bash' 'hook')"
 
@@ -15,7 +16,7 @@ eval "$(G:/anaconda/Scripts/conda.exe 'shell.bash' 'hook')"
 conda activate pytorch
 
 # 1. Generate Vectors
-echo "[1/3] Generating System Vectors..."
+echo "[1/4] Generating System Vectors..."
 python src/gen_vectors_top.py
 
 if [ $? -ne 0 ]; then
@@ -24,7 +25,7 @@ if [ $? -ne 0 ]; then
 fi
 
 # 2. Compile
-echo "[2/3] Compiling RTL & Testbench..."
+echo "[2/4] Compiling RTL & Testbench..."
 
 iverilog -g2005-sv -I src -o ${SIM_OUT} \
     src/params.vh \
@@ -39,6 +40,7 @@ iverilog -g2005-sv -I src -o ${SIM_OUT} \
     src/ppu.v \
     src/axi_lite_control.v \
     src/output_buffer_ctrl.v \
+    src/perf_counters.v \
     src/${MODULE}.v \
     src/${TB_MODULE}.v
 
@@ -48,12 +50,21 @@ if [ $? -ne 0 ]; then
 fi
 
 # 3. Simulate
-echo "[3/3] Running Simulation..."
-vvp ${SIM_OUT}
+echo "[3/4] Running Simulation..."
+vvp ${SIM_OUT} | tee ${SIM_LOG}
 gtkwave ${VCD_FILE} &
 if [ $? -ne 0 ]; then
     echo "❌ Simulation Runtime Failed"
     exit 1
 fi
 
+# 4. Check Performance Counters against the model
+echo "[4/4] Checking Performance Counters..."
+python src/perf_counters.py ${SIM_LOG} 32 4
+
+if [ $? -ne 0 ]; then
+    echo "❌ Performance Counter Check Failed"
+    exit 1
+fi
+
 echo "✅ System Verification Complete."
\ No newline at end of file
@@ -0,0 +1,94 @@
+#!/bin/bash
+# -----------------------------------------------------------------------------
+# Script: simulate_top_stream.sh
+# 描述: DeiT 加速器顶层 Streaming 仿真
+#       Python 通过命名管道边生成边喂激励，TB 输出经另一管道回传比对，
+#       不写任何 .mem 文件，磁盘占用与矩阵规模无关。
+# 用法: bash src/simulate_top_stream.sh [M] [K] [N]
+#       VCD=1 bash src/simulate_top_stream.sh ...   导出波形 (默认关闭)
+#       M > 256 覆盖 M-Chunk Chaining，M > 512 覆盖按组拆分 (见 regress_top_stream.sh)
+# -----------------------------------------------------------------------------
+
+MODULE="deit_accelerator_top"
+TB_MODULE="${MODULE}_stream_tb"
+SIM_OUT="src/${MODULE}_stream_sim.out"
+SIM_LOG="src/top_stream_sim.log"
+
+M_DIM=${1:-32}
+K_DIM=${2:-24}
+N_DIM=${3:-32}
+
+PIPE_DIR=$(mktemp -d)
+STIM_FIFO="${PIPE_DIR}/stim.fifo"
+OUT_FIFO="${PIPE_DIR}/out.fifo"
+trap 'rm -rf "${PIPE_DIR}"' EXIT
+
+# 1. Compile (先编译，避免 Python 端阻塞在 open() 上)
+echo "[1/4] Compiling RTL & Streaming Testbench..."
+
+iverilog -g2005-sv -I src -o ${SIM_OUT} \
+    src/params.vh \
+    src/pe.v \
+    src/single_column_bank.v \
+    src/accumulator_bank.v \
+    src/systolic_array.v \
+    src/input_buffer_ctrl.v \
+    src/weight_buffer_ctrl.v \
+    src/global_controller.v \
+    src/deit_core.v \
+    src/ppu.v \
+    src/axi_lite_control.v \
+    src/output_buffer_ctrl.v \
+    src/perf_counters.v \
+    src/${MODULE}.v \
+    src/${TB_MODULE}.v
+
+if [ $? -ne 0 ]; then
+    echo "❌ Compilation Failed"
+    exit 1
+fi
+
+# 2. Start Generator / Checker (后台)
+echo "[2/4] Starting Stream Generator (M=${M_DIM}, K=${K_DIM}, N=${N_DIM})..."
+mkfifo "${STIM_FIFO}" "${OUT_FIFO}"
+python src/gen_vectors_top_stream.py "${STIM_FIFO}" "${OUT_FIFO}" ${M_DIM} ${K_DIM} ${N_DIM} &
+PY_PID=$!
+
+# 3. Simulate (与生成并行)
+echo "[3/4] Running Simulation..."
+vvp ${SIM_OUT} +STIM="${STIM_FIFO}" +OUT="${OUT_FIFO}" ${VCD:+"+VCD"} | tee ${SIM_LOG}
+SIM_RET=${PIPESTATUS[0]}
+
+# vvp 先退出 (例如 [FATAL] 后 $finish) 时，Python 可能仍阻塞在管道 open()/read 上:
+# 给比对端留出收尾时间，超时则强制结束，保证脚本失败而不是挂起
+for i in $(seq 1 ${PY_TIMEOUT:-30}); do
+    kill -0 ${PY_PID} 2>/dev/null || break
+    sleep 1
+done
+if kill -0 ${PY_PID} 2>/dev/null; then
+    echo "❌ Stream Generator did not finish after simulation exit, killing it"
+    kill ${PY_PID}
+fi
+wait ${PY_PID}
+PY_RET=$?
+
+if [ ${SIM_RET} -ne 0 ]; then
+    echo "❌ Simulation Runtime Failed"
+    exit 1
+fi
+if [ ${PY_RET} -ne 0 ]; then
+    echo "❌ Streaming Golden Check Failed"
+    exit 1
+fi
+
+# 4. Check Performance Counters against the model
+echo "[4/4] Checking Performance Counters..."
+NUM_JOBS=$(sed -n 's/.*\[TB\] M=[0-9]*, Jobs=\([0-9]*\).*/\1/p' ${SIM_LOG})
+python src/perf_counters.py ${SIM_LOG} ${M_DIM} ${NUM_JOBS:-0}
+
+if [ $? -ne 0 ]; then
+    echo "❌ Performance Counter Check Failed"
+    exit 1
+fi
+
+echo "✅ Streaming System Verification Complete."
@@ -0,0 +1,283 @@
+import numpy as np
+from collections import namedtuple
+
+from golden_gemm import golden_matmul
+
+# ==============================================================================
+# 1. 硬件参数 (与 params.vh / global_controller.v 保持一致)
+# ==============================================================================
+ARRAY_ROW = 12
+ARRAY_COL = 16
+
+# --- M-Chunk Chaining (deit_accelerator_top.v) ---
+# Input Buffer 单 Bank 256 行；M 更大时按 CHUNK_ROWS 分块，共享同一份驻留权重。
+# 单 Job 的行数上限 = Accumulator 深度 2^ACC_ADDR_WIDTH (硬件界限)。
+# 更长的序列由软件按 MAX_SEQ_LEN 拆成若干组，每组独立走一遍调度表。
+CHUNK_ROWS  = 256
+MAX_SEQ_LEN = 512
+
+# --- global_controller 各状态周期数 (由 RTL 推导) ---
+# LOAD_W : Phase 1 (DMA 窗口 27 cyc) + Weight Buffer 握手延迟 3 cyc + Phase 2 (12 行)
+# COMPUTE: M + 4 x Chunk 数 (每块: stream_en 寄存 1 cyc + Input Buffer valid 延迟 3 cyc)
+# M_WAIT : 每次换块至少 4 cyc (排空 valid 尾巴)；下一块未写满时更长
+# DRAIN  : LATENCY_CFG (deit_accelerator_top 中为 27)
+# DONE   : 1
+CYC_LOAD_W        = 27 + 3 + ARRAY_ROW
+CYC_INPUT_LATENCY = 4
+CYC_M_WAIT        = 4
+CYC_DRAIN         = 27
+CYC_DONE          = 1
+
+# --- AXI-Stream 节拍数 (64-bit) ---
+BEATS_PER_W_ROW = (ARRAY_COL * 8) // 64   # 128-bit 权重行 -> 2 beats
+
+# 一个调度单元 = 一次 ap_start (LOAD_W -> COMPUTE -> DRAIN -> DONE)
+#   k_idx, n_idx : 在 Padding 后矩阵中的 Tile 坐标
+#   acc_mode     : 0 = Overwrite (该 N 列第一个下发的 Tile), 1 = Accumulate
+#   output_en    : 1 = 该 N 列最后一个下发的 Tile, 打开 PPU 输出
+#   w_rows       : 需要经 DMA 发送的权重行数 (去掉尾部 Padding 行)
+Tile = namedtuple("Tile", ["k_idx", "n_idx", "acc_mode", "output_en", "w_rows"])
+
+# ==============================================================================
+# 2. 辅助函数
+# ==============================================================================
+def ceil_div(a, b):
+    return (a + b - 1) // b
+
+def pad_to_array(mat_a, mat_b):
+    """把 A[M,K] / B[K,N] 补零到 K % 12 == 0, N % 16 == 0"""
+    m_dim, k_dim = mat_a.shape
+    n_dim = mat_b.shape[1]
+    k_pad = ceil_div(k_dim, ARRAY_ROW) * ARRAY_ROW
+    n_pad = ceil_div(n_dim, ARRAY_COL) * ARRAY_COL
+
+    a_pad = np.zeros((m_dim, k_pad), dtype=mat_a.dtype)
+    b_pad = np.zeros((k_pad, n_pad), dtype=mat_b.dtype)
+    a_pad[:, :k_dim] = mat_a
+    b_pad[:k_dim, :n_dim] = mat_b
+    return a_pad, b_pad
+
+def weight_tile(b_pad, k_idx, n_idx):
+    r0 = k_idx * ARRAY_ROW
+    c0 = n_idx * ARRAY_COL
+    return b_pad[r0 : r0 + ARRAY_ROW, c0 : c0 + ARRAY_COL]
+
+def seq_groups(m_dim):
+    """任意 M -> [(起始行, 行数)]，每组不超过单 Job 上限 MAX_SEQ_LEN"""
+    return [(r0, min(MAX_SEQ_LEN, m_dim - r0)) for r0 in range(0, m_dim, MAX_SEQ_LEN)]
+
+def chunk_rows(m_dim):
+    """单个 Job 的 M 行按 Input Buffer 深度切分后每个 Chunk 的行数"""
+    if not 0 < m_dim <= MAX_SEQ_LEN:
+        raise ValueError(f"M={m_dim} 超出单 Job 范围 (1 ~ {MAX_SEQ_LEN})")
+    return [min(CHUNK_ROWS, m_dim - r0) for r0 in range(0, m_dim, CHUNK_ROWS)]
+
+def job_state_cycles(m_dim):
+    """单次 ap_start 在 global_controller 各状态停留的周期数 (不含 IDLE)
+    M_WAIT 为下一块已提前写满时的下限。"""
+    n_chunks = len(chunk_rows(m_dim))
+    return {
+        "LOAD_W":  CYC_LOAD_W,
+        "COMPUTE": m_dim + CYC_INPUT_LATENCY * n_chunks,
+        "M_WAIT":  CYC_M_WAIT * (n_chunks - 1),
+        "DRAIN":   CYC_DRAIN,
+        "DONE":    CYC_DONE,
+    }
+
+def job_cycles(m_dim):
+    return sum(job_state_cycles(m_dim).values())
+
+def input_beats(m_dim):
+    """一个 K-Tile 的输入 (M x 96-bit) 经 Gearbox 所需的 64-bit 节拍数 (各 Chunk 分别补齐)"""
+    return sum(ceil_div(rows * ARRAY_ROW * 8, 64) for rows in chunk_rows(m_dim))
+
+def seq_cycles(m_dim):
+    """任意 M 下，同一 Tile 在所有分组上的周期数之和"""
+    return sum(job_cycles(rows) for _, rows in seq_groups(m_dim))
+
+def seq_input_beats(m_dim):
+    return sum(input_beats(rows) for _, rows in seq_groups(m_dim))
+
+# ==============================================================================
+# 3. Tile 调度生成
+# ==============================================================================
+def build_schedule(k_dim, n_dim, mat_b=None, skip_zero=True):
+    """
+    生成 Tile 调度表 (N 外层, K 内层，与 Top TB 的下发顺序一致)。
+
+    - skip_zero: 全零权重 Tile (Padding 或剪枝产生) 不再下发。
+      被跳过的 Tile 对累加结果没有贡献，只需把 acc_mode=0 (Overwrite)
+      顺延给该列第一个实际下发的 Tile 即可。
+    - 每个 Tile 的 w_rows 去掉 K 方向尾部 Padding 行。未发送的行在
+      Weight Buffer 中保留旧值，但对应的输入列恒为 0，不影响结果。
+    """
+    num_k_tiles = ceil_div(k_dim, ARRAY_ROW)
+    num_n_tiles = ceil_div(n_dim, ARRAY_COL)
+    if mat_b is not None:
+        _, b_pad = pad_to_array(np.zeros((1, k_dim), dtype=mat_b.dtype), mat_b)
+
+    schedule = []
+    for n_idx in range(num_n_tiles):
+        issued = []
+        for k_idx in range(num_k_tiles):
+            if skip_zero and mat_b is not None:
+                if not np.any(weight_tile(b_pad, k_idx, n_idx)):
+                    continue
+            issued.append(k_idx)
+
+        # 整列全零: 仍需下发一个 Tile，让 Accumulator 被覆盖为 0 并经 PPU 输出 Bias
+        if not issued:
+            issued = [num_k_tiles - 1]
+
+        for i, k_idx in enumerate(issued):
+            w_rows = min(ARRAY_ROW, k_dim - k_idx * ARRAY_ROW)
+            schedule.append(Tile(
+                k_idx     = k_idx,
+                n_idx     = n_idx,
+                acc_mode  = 0 if i == 0 else 1,
+                output_en = 1 if i == len(issued) - 1 else 0,
+                w_rows    = w_rows,
+            ))
+    return schedule
+
+# ==============================================================================
+# 4. 功能模拟 (Bit-exact, 模拟 Accumulator 的 Overwrite/Accumulate 语义)
+# ==============================================================================
+def simulate_schedule(mat_a, mat_b, schedule):
+    """
+    按调度表逐 Tile 模拟硬件，返回 (INT32 结果 [M, N], 统计信息)。
+    Weight Buffer 为 Ping-Pong 结构，未通过 DMA 覆盖的行保留同一 Bank 上次的内容。
+    """
+    m_dim, k_dim = mat_a.shape
+    n_dim = mat_b.shape[1]
+    a_pad, b_pad = pad_to_array(mat_a, mat_b)
+
+    acc = np.zeros((m_dim, b_pad.shape[1]), dtype=np.int32)
+    w_banks = [np.zeros((ARRAY_ROW, ARRAY_COL), dtype=np.int32) for _ in range(2)]
+    bank_sel = 0
+
+    for t in schedule:
+        # --- Weight DMA: 只写入前 w_rows 行 ---
+        w_src = weight_tile(b_pad, t.k_idx, t.n_idx)
+        w_banks[bank_sel][: t.w_rows, :] = w_src[: t.w_rows, :]
+        w_array = w_banks[bank_sel]
+        bank_sel ^= 1
+
+        # --- Compute ---
+        k0 = t.k_idx * ARRAY_ROW
+        psum = golden_matmul(a_pad[:, k0 : k0 + ARRAY_ROW], w_array)
+
+        c0 = t.n_idx * ARRAY_COL
+        if t.acc_mode:
+            acc[:, c0 : c0 + ARRAY_COL] += psum
+        else:
+            acc[:, c0 : c0 + ARRAY_COL] = psum
+
+    return acc[:, :n_dim], schedule_stats(m_dim, k_dim, n_dim, schedule)
+
+def long_seq_gemm(mat_a, mat_b, skip_zero=True):
+    """
+    单次调用完成任意 M 的 [M, K] x [K, N]，返回 (INT32 结果, 统计信息)。
+    - 每组 (<= MAX_SEQ_LEN 行) 内，每个 Tile 只加载一次权重，
+      M 方向的 Chunk 在同一次 ap_start 内串行完成 (M-Chunk Chaining)
+    - 组数 = ceil(M / MAX_SEQ_LEN)，每组重放同一张调度表 (受 Accumulator 深度限制)
+    """
+    m_dim = mat_a.shape[0]
+    if m_dim < 1:
+        raise ValueError(f"M={m_dim}: 至少需要 1 行输入")
+    schedule = build_schedule(mat_a.shape[1], mat_b.shape[1], mat_b, skip_zero)
+
+    result = np.empty((m_dim, mat_b.shape[1]), dtype=np.int32)
+    groups = seq_groups(m_dim)
+    for r0, rows in groups:
+        result[r0 : r0 + rows], _ = simulate_schedule(mat_a[r0 : r0 + rows], mat_b, schedule)
+
+    stats = schedule_stats(m_dim, mat_a.shape[1], mat_b.shape[1], schedule)
+    stats["jobs"] = len(schedule) * len(groups)
+    return result, stats
+
+# ==============================================================================
+# 5. 性能模型
+# ==============================================================================
+def schedule_stats(m_dim, k_dim, n_dim, schedule):
+    """对比 "全部下发" 与给定调度表的周期数 / DMA 节拍数"""
+    num_full = ceil_div(k_dim, ARRAY_ROW) * ceil_div(n_dim, ARRAY_COL)
+    num_issued = len(schedule)
+
+    full_cycles = num_full * seq_cycles(m_dim)
+    sched_cycles = num_issued * seq_cycles(m_dim)
+
+    full_w_beats = num_full * ARRAY_ROW * BEATS_PER_W_ROW
+    sched_w_beats = sum(t.w_rows * BEATS_PER_W_ROW for t in schedule)
+    full_in_beats = num_full * seq_input_beats(m_dim)
+    sched_in_beats = num_issued * seq_input_beats(m_dim)
+
+    return {
+        "tiles_total":    num_full,
+        "tiles_issued":   num_issued,
+        "tiles_skipped":  num_full - num_issued,
+        "cycles_total":   full_cycles,
+        "cycles_issued":  sched_cycles,
+        "cycles_saved":   full_cycles - sched_cycles,
+        "w_beats_saved":  full_w_beats - sched_w_beats,
+        "in_beats_saved": full_in_beats - sched_in_beats,
+    }
+
+def print_stats(name, stats):
+    pct = 100.0 * stats["cycles_saved"] / max(stats["cycles_total"], 1)
+    print(f"  [{name}] Tiles: {stats['tiles_issued']}/{stats['tiles_total']} "
+          f"(跳过 {stats['tiles_skipped']})")
+    print(f"      Cycles: {stats['cycles_issued']} / {stats['cycles_total']} "
+          f"(节省 {stats['cycles_saved']}, {pct:.1f}%)")
+    print(f"      DMA Beats 节省: Weight {stats['w_beats_saved']}, "
+          f"Input {stats['in_beats_saved']}")
+
+# ==============================================================================
+# 6. Demo: DeiT-Tiny 形状 + 块剪枝
+# ==============================================================================
+def prune_tiles(mat_b, ratio, rng):
+    """按 12x16 Tile 随机置零，模拟结构化剪枝"""
+    k_dim, n_dim = mat_b.shape
+    mat_b = mat_b.copy()
+    for k_idx in range(ceil_div(k_dim, ARRAY_ROW)):
+        for n_idx in range(ceil_div(n_dim, ARRAY_COL)):
+            if rng.random() < ratio:
+                r0, c0 = k_idx * ARRAY_ROW, n_idx * ARRAY_COL
+                mat_b[r0 : r0 + ARRAY_ROW, c0 : c0 + ARRAY_COL] = 0
+    return mat_b
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    # (名称, M, K, N): QK^T 的 K=64 -> 5 个满 Tile + 1 个 4 行 Tile
+    shapes = [
+        ("Attn QK^T", 197,  64, 197),
+        ("Attn AV",   197, 197,  64),
+        ("QKV Proj",  197, 192, 576),
+        ("MLP FC1",   197, 192, 768),
+        ("MLP FC2",   197, 768, 192),
+    ]
+
+    print("=== Zero-Tile Skipping (剪枝率 25%) ===")
+    for name, m_dim, k_dim, n_dim in shapes:
+        mat_a = rng.integers(-128, 128, size=(m_dim, k_dim), dtype=np.int8)
+        mat_b = rng.integers(-128, 128, size=(k_dim, n_dim), dtype=np.int8)
+        mat_b = prune_tiles(mat_b, 0.25, rng)
+
+        schedule = build_schedule(k_dim, n_dim, mat_b)
+        result, stats = simulate_schedule(mat_a, mat_b, schedule)
+
+        golden = golden_matmul(mat_a, mat_b)
+        assert np.array_equal(result, golden), f"{name}: 调度结果与 Golden 不一致"
+        print_stats(name, stats)
+
+    # 长序列: M > Input Buffer 深度由 M-Chunk Chaining 在单个 Job 内完成，
+    #         M > MAX_SEQ_LEN 时再按组拆分
+    print("=== Long Sequence (M-Chunk Chaining) ===")
+    for m_dim in (CHUNK_ROWS, CHUNK_ROWS + 1, MAX_SEQ_LEN, MAX_SEQ_LEN + 1, 1500):
+        mat_a = rng.integers(-128, 128, size=(m_dim, 192), dtype=np.int8)
+        mat_b = rng.integers(-128, 128, size=(192, 64), dtype=np.int8)
+        result, stats = long_seq_gemm(mat_a, mat_b)
+        assert np.array_equal(result, golden_matmul(mat_a, mat_b)), f"M={m_dim}: 结果不一致"
+        chunks = sum(len(chunk_rows(rows)) for _, rows in seq_groups(m_dim))
+        print(f"  [M={m_dim}] Groups: {len(seq_groups(m_dim))}, Chunks: {chunks}, "
+              f"Jobs: {stats['jobs']}, Cycles: {stats['cycles_issued']}")